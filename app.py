@@ -1,3 +1,4 @@
+import io
 import pandas as pd
 import streamlit as st
 import logging
@@ -49,42 +50,51 @@ st.markdown("---")
 uploaded_file = st.file_uploader("📁 Upload your CSV file", type=["csv"])
 
 # --- Null Handling Logic ---
+def _drop_sparse_columns(df):
+    threshold = len(df) * 0.5
+    return df.dropna(thresh=threshold, axis=1)
+
+NULL_HANDLERS = {
+    "Drop rows with nulls": lambda df: df.dropna(),
+    "Fill with N/A": lambda df: df.fillna("N/A"),
+    "Fill with 0": lambda df: df.fillna(0),
+    "Fill with column mean": lambda df: df.fillna(df.mean(numeric_only=True)),
+    "Fill with column median": lambda df: df.fillna(df.median(numeric_only=True)),
+    "Drop columns with >50% nulls": _drop_sparse_columns,
+}
+
 def handle_nulls(df, method):
-    if method == "Drop rows with nulls":
-        df = df.dropna()
-    elif method == "Fill with N/A":
-        df = df.fillna("N/A")
-    elif method == "Fill with 0":
-        df = df.fillna(0)
-    elif method == "Fill with column mean":
-        df = df.fillna(df.mean(numeric_only=True))
-    elif method == "Fill with column median":
-        df = df.fillna(df.median(numeric_only=True))
-    elif method == "Drop columns with >50% nulls":
-        threshold = len(df) * 0.5
-        df = df.dropna(thresh=threshold, axis=1)
-    return df
+    handler = NULL_HANDLERS.get(method)
+    return handler(df) if handler is not None else df
 
 # --- Cleaning Function ---
-def clean_csv(file, null_option):
-    try:
-        df = pd.read_csv(file)
+@st.cache_data(show_spinner=False)
+def clean_dataframe(file_bytes, null_option):
+    # Cached on the uploaded bytes, so re-running the same file is instant
+    df = pd.read_csv(io.BytesIO(file_bytes))
+    preview = df.head()
 
-        st.markdown("### 📌 Original Data Preview")
-        st.dataframe(df.head(), use_container_width=True)
+    # Clean column names
+    df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
 
-        # Clean column names
-        df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
+    # Drop duplicates (one uint64 hash per row, then a single dedup pass)
+    df = df.loc[~pd.util.hash_pandas_object(df, index=False).duplicated()]
 
-        # Drop duplicates
-        df.drop_duplicates(inplace=True)
+    # Drop fully empty rows/cols
+    df = df.dropna(how="all")
+    df = df.dropna(axis=1, how="all")
 
-        # Drop fully empty rows/cols
-        df.dropna(how="all", inplace=True)
-        df.dropna(axis=1, how="all", inplace=True)
+    # Null handling
+    df = handle_nulls(df, null_option)
 
-        # Null handling
-        df = handle_nulls(df, null_option)
+    return preview, df
+
+def clean_csv(file, null_option):
+    try:
+        original_preview, df = clean_dataframe(file.getvalue(), null_option)
+
+        st.markdown("### 📌 Original Data Preview")
+        st.dataframe(original_preview, use_container_width=True)
 
         st.success("✅ Cleaning Complete!")
         st.markdown("### ✨ Cleaned Data Preview")
@@ -100,14 +110,7 @@ def clean_csv(file, null_option):
 # --- App Logic ---
 if uploaded_file:
     st.markdown("### 🧪 Choose how to handle NULL values")
-    null_option = st.selectbox("How should we handle missing values?", [
-        "Drop rows with nulls",
-        "Fill with N/A",
-        "Fill with 0",
-        "Fill with column mean",
-        "Fill with column median",
-        "Drop columns with >50% nulls"
-    ])
+    null_option = st.selectbox("How should we handle missing values?", list(NULL_HANDLERS))
 
     # Add a button to trigger the cleaning process
     if st.button("Start Cleaning Process", key="clean_button"):
@@ -10,5 +10,5 @@ if [ -z "$INPUT" ] || [ -z "$OUTPUT" ]; then
   exit 1
 fi
 
-python3 clean_csv.py "$INPUT" "$OUTPUT"
+python3 csv_cleaner.py "$INPUT" "$OUTPUT"
 echo "Cleaning complete! Output saved to $OUTPUT 🎉"
@@ -1,10 +1,28 @@
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 import numpy as np
+import os
 import sys
 import logging
 from datetime import datetime
 import re
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; detect_outliers falls back to NumPy
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    # Read text into Arrow-backed string columns (real NA, Arrow string kernels)
+    _TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:  # pyarrow is optional; fall back to pandas' own strings and to_csv
+    pa = None
+    _TEXT_DTYPE = 'string'
 
 # Set up logging
 logging.basicConfig(
@@ -13,82 +31,273 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def detect_outliers(df: pd.DataFrame, columns: List[str], n_std: float = 3) -> pd.DataFrame:
-    """Remove outliers based on z-score method."""
-    for column in columns:
-        if df[column].dtype in ['int64', 'float64']:
-            z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-            df = df[z_scores < n_std]
+# Precompiled patterns used by clean_string_columns
+_WHITESPACE_RUN = re.compile(r'[ \n\t]+')
+_SPECIAL_CHARS = re.compile(r'[^a-z0-9\s.,!?-]')
+
+# Number of rows read from the input file at a time
+CHUNK_SIZE = 250_000
+
+# Rows sampled to decide whether a text column is cleaned per distinct value
+CARDINALITY_SAMPLE = 1_000
+
+# Rows sampled to decide whether a column is worth converting to numeric
+TYPE_INFERENCE_SAMPLE = 1_000
+
+# Formats tried by convert_dates when pandas cannot guess one
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d',
+                '%d-%m-%Y', '%m-%d-%Y', '%Y%m%d']
+
+if njit is not None:
+    # fastmath without 'nnan'/'ninf' so the NaN checks below are kept
+    _FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+    @njit(parallel=True, nogil=True, fastmath=_FASTMATH, cache=True)
+    def _column_stats(a, means, stds):
+        """Per-column mean and sample std of a, ignoring NaN (Welford)."""
+        nrows, ncols = a.shape
+        for j in prange(ncols):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            for i in range(nrows):
+                x = a[i, j]
+                if not np.isnan(x):
+                    n += 1
+                    delta = x - mean
+                    mean += delta / n
+                    m2 += delta * (x - mean)
+            means[j] = mean if n > 0 else np.nan
+            stds[j] = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+
+    @njit(parallel=True, nogil=True, fastmath=_FASTMATH, cache=True)
+    def _zscore_mask(a, means, stds, n_std, out):
+        """Set out[i] to whether every non-NaN cell of row i is within n_std."""
+        nrows, ncols = a.shape
+        for i in prange(nrows):
+            keep = True
+            for j in range(ncols):
+                x = a[i, j]
+                if not np.isnan(x) and not abs(x - means[j]) < n_std * stds[j]:
+                    keep = False
+                    break
+            out[i] = keep
+
+def _thread_map(func: Callable, items: list) -> list:
+    """Map func over items in a thread pool sized to the CPU count."""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    # Arrow kernels, NumPy ufuncs and nogil numba kernels release the GIL,
+    # so threads run concurrently without process-pool IPC
+    with ThreadPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1)) as pool:
+        return list(pool.map(func, items))
+
+def _column_shards(n_columns: int) -> List[slice]:
+    """Split column positions into one contiguous slice per CPU."""
+    n_shards = min(n_columns, os.cpu_count() or 1)
+    bounds = np.linspace(0, n_columns, n_shards + 1).astype(int).tolist()
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+def detect_outliers(df: pd.DataFrame, columns: List[str], n_std: float = 3,
+                    means: Optional[dict] = None, stds: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Remove outliers based on z-score method.
+
+    When means and stds are given (column name -> value), rows are scored
+    against those statistics instead of ones computed from df itself. This is
+    how chunks of a large file are scored against whole-file statistics.
+    """
+    columns = [column for column in columns if pd.api.types.is_numeric_dtype(df[column])
+               and not pd.api.types.is_bool_dtype(df[column])]
+    if means is not None and stds is not None:
+        columns = [column for column in columns if column in means and column in stds]
+    if not columns or df.empty:
+        return df
+
+    # Score every column against the same statistics and slice the frame once
+    if njit is not None:
+        # pandas usually hands back a column-major matrix; the stats kernel
+        # scans columns and the mask kernel scans rows, so each gets the
+        # memory layout it walks contiguously
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if means is not None and stds is not None:
+            means = np.array([means[column] for column in columns], dtype=np.float64)
+            stds = np.array([stds[column] for column in columns], dtype=np.float64)
+        else:
+            means = np.empty(len(columns), dtype=np.float64)
+            stds = np.empty(len(columns), dtype=np.float64)
+            _column_stats(np.asfortranarray(values), means, stds)
+        values = np.ascontiguousarray(values)
+        stds[~(stds > 0)] = 1  # Guard against constant (or single-value) columns
+
+        # Missing values are not outliers; they are left for handle_missing_values
+        mask = np.empty(len(values), dtype=np.bool_)
+        _zscore_mask(values, means, stds, float(n_std), mask)
+        return df.loc[mask]
+
+    # Without numba, AND per-column masks together so temporaries stay O(rows)
+    # and columns of different dtypes are never packed into one matrix;
+    # column shards are scored in parallel threads
+    def shard_mask(shard: slice) -> np.ndarray:
+        mask = np.ones(len(df), dtype=bool)
+        for column in columns[shard]:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if means is not None and stds is not None:
+                mean, std = means[column], stds[column]
+            else:
+                mean, std = np.nanmean(values), np.nanstd(values, ddof=1)
+            if not std > 0:  # Guard against constant (or single-value) columns
+                std = 1
+
+            # Missing values are not outliers; they are left for handle_missing_values
+            mask &= (np.abs(values - mean) < n_std * std) | np.isnan(values)
+        return mask
+
+    return df.loc[np.logical_and.reduce(_thread_map(shard_mask, _column_shards(len(columns))))]
+
+def _apply_by_column(df: pd.DataFrame, columns: List[str], func: Callable[[pd.Series], pd.Series]) -> pd.DataFrame:
+    """Run func on each column in a thread pool and assign the results back."""
+    columns = list(columns)
+    results = _thread_map(lambda col: func(df[col]), columns)
+    for col, result in zip(columns, results):
+        df[col] = result
     return df
 
+def _clean_strings(s: pd.Series) -> pd.Series:
+    """Apply all string cleaning operations as one vectorized chain."""
+    return (s.str.strip()  # Remove leading/trailing whitespace
+             .str.lower()  # Convert to lowercase
+             .str.replace(_WHITESPACE_RUN, ' ', regex=True)  # Newlines, tabs, multiple spaces
+             .str.replace(_SPECIAL_CHARS, '', regex=True))  # Keep basic punctuation only
+
+def _clean_string_column(s: pd.Series) -> pd.Series:
+    """Clean one text column."""
+    # Convert to string dtype first to handle any mixed types, keeping
+    # columns that already are strings (and their Arrow storage) as they are
+    if not isinstance(s.dtype, pd.StringDtype):
+        s = s.astype(_TEXT_DTYPE)
+
+    # Low-cardinality columns (status, country, ...) only need each
+    # distinct value cleaned once; estimate cardinality from a sample
+    head = s.head(CARDINALITY_SAMPLE)
+    if head.nunique() <= 0.5 * len(head):
+        codes, uniques = pd.factorize(s)
+        cleaned = _clean_strings(pd.Series(uniques, dtype=s.dtype))
+        return pd.Series(cleaned.array.take(codes, allow_fill=True), index=s.index, name=s.name)
+    return _clean_strings(s)
+
 def clean_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Advanced string cleaning for text columns."""
-    for col in df.select_dtypes(include='object').columns:
-        # Convert to string type first to handle any mixed types
-        df[col] = df[col].astype(str)
-        
-        # Apply cleaning operations
-        df[col] = df[col].apply(lambda x: x.strip()  # Remove leading/trailing whitespace
-                               .lower()  # Convert to lowercase
-                               .replace('\n', ' ')  # Remove newlines
-                               .replace('\t', ' ')  # Remove tabs
-                               )
-        
-        # Remove multiple spaces
-        df[col] = df[col].apply(lambda x: re.sub(' +', ' ', x))
-        
-        # Remove special characters but keep basic punctuation
-        df[col] = df[col].apply(lambda x: re.sub(r'[^a-z0-9\s.,!?-]', '', x))
-    
-    return df
+    columns = df.select_dtypes(include=['object', 'string']).columns
+    return _apply_by_column(df, columns, _clean_string_column)
+
+def _coerce_numeric(s: pd.Series) -> pd.Series:
+    """pd.to_numeric(errors='coerce') with unparseable values always reported missing."""
+    num_values = pd.to_numeric(s, errors='coerce')
+    # Arrow-backed input comes back with NaN rather than NA for failed values
+    return num_values.mask(np.isnan(num_values.to_numpy(dtype=np.float64, na_value=np.nan)))
+
+def _downcast(num_values: pd.Series) -> pd.Series:
+    """Downcast a numeric column to the narrowest dtype that holds its values exactly."""
+    # The whole-value test runs on NumPy since Arrow dtypes lack mod
+    if pd.api.types.is_integer_dtype(num_values) or np.all(
+            np.mod(num_values.dropna().to_numpy(dtype=np.float64), 1) == 0):
+        return pd.to_numeric(num_values, downcast='integer')
+    return pd.to_numeric(num_values, downcast='float')
+
+def _sample_is_numeric(s: pd.Series) -> bool:
+    """Whether more than 80% of a random sample of s is numeric."""
+    if s.empty:
+        return False
+    # Drawing positions directly keeps this O(sample) rather than O(rows)
+    positions = np.random.default_rng(0).choice(
+        len(s), size=min(TYPE_INFERENCE_SAMPLE, len(s)), replace=False)
+    sample = s.iloc[positions]
+    return _coerce_numeric(sample).notna().sum() / len(sample) > 0.8
+
+def _infer_column_type(s: pd.Series) -> pd.Series:
+    """Convert one column to numeric if most of its values are numeric."""
+    if s.empty:
+        return s
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        # Already numeric, so there is nothing to sample; just downcast
+        return _downcast(s)
+
+    # Try converting to numeric
+    try:
+        # Rule out clearly non-numeric columns from a sample first
+        if not _sample_is_numeric(s):
+            return s
+
+        num_values = _coerce_numeric(s)
+        # If more than 80% of values are numeric, convert the column
+        if num_values.notna().sum() / len(s) > 0.8:
+            num_values = _downcast(num_values)
+            logger.debug(f"Converted column '{s.name}' to {num_values.dtype}")
+            return num_values
+    except (TypeError, ValueError):
+        # Values pd.to_numeric cannot coerce at all (e.g. nested objects)
+        pass
+    return s
 
 def infer_and_convert_types(df: pd.DataFrame) -> pd.DataFrame:
     """Infer and convert column types."""
-    # Try to convert numeric columns
-    for col in df.columns:
-        # Skip date columns
-        if 'date' in col.lower():
-            continue
-            
-        # Try converting to numeric
-        try:
-            num_values = pd.to_numeric(df[col], errors='coerce')
-            # If more than 80% of values are numeric, convert the column
-            if num_values.notna().sum() / len(df) > 0.8:
-                df[col] = num_values
-        except:
-            continue
-    
-    return df
+    # Try to convert numeric columns, skipping date columns
+    columns = [col for col in df.columns if 'date' not in col.lower()]
+    return _apply_by_column(df, columns, _infer_column_type)
+
+def _date_sample(s: pd.Series) -> pd.Series:
+    """The first few non-missing values of a date column, as text."""
+    return s.dropna().astype(str).head(32)
+
+def _convert_date_column(s: pd.Series, date_formats: List[str],
+                         date_format: Optional[str] = None) -> pd.Series:
+    """Parse one date column, with date_format if given."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    if date_format is None:
+        # Pick the format from a small sample, then parse the column once
+        date_format = _guess_date_format(_date_sample(s), date_formats)
+    return pd.to_datetime(s, format=date_format, errors='coerce', cache=True)
 
-def convert_dates(df: pd.DataFrame, date_formats: Optional[List[str]] = None) -> pd.DataFrame:
-    """Convert date columns with multiple format support."""
+def convert_dates(df: pd.DataFrame, date_formats: Optional[List[str]] = None,
+                  column_formats: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Convert date columns with multiple format support.
+
+    column_formats (column name -> format) fixes the format of those columns,
+    e.g. one decided for a whole file; other columns are guessed from df.
+    """
     if date_formats is None:
-        date_formats = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d', 
-                       '%d-%m-%Y', '%m-%d-%Y', '%Y%m%d']
-    
-    for col in df.columns:
-        if 'date' in col.lower():
-            # Try each format
-            for date_format in date_formats:
-                try:
-                    df[col] = pd.to_datetime(df[col], format=date_format, errors='coerce')
-                    if df[col].notna().sum() > 0:  # If successful conversion
-                        break
-                except:
-                    continue
-    
-    return df
+        date_formats = DATE_FORMATS
+    if column_formats is None:
+        column_formats = {}
+
+    columns = [col for col in df.columns if 'date' in col.lower()]
+    return _apply_by_column(df, columns, lambda s: _convert_date_column(
+        s, date_formats, column_formats.get(s.name)))
+
+def _guess_date_format(sample: pd.Series, date_formats: List[str]) -> str:
+    """Return the format of the sampled dates, or 'mixed' if none is found."""
+    if sample.empty:
+        return 'mixed'
+    date_format = guess_datetime_format(sample.iloc[0])
+    if date_format is not None:
+        return date_format
+    for date_format in date_formats:
+        if pd.to_datetime(sample, format=date_format, errors='coerce').notna().any():
+            return date_format
+    return 'mixed'
 
 def generate_data_profile(df: pd.DataFrame) -> None:
     """Generate basic data profile."""
     logger.info("\nData Profile:")
     logger.info(f"Total Rows: {len(df)}")
     logger.info(f"Total Columns: {len(df.columns)}")
-    logger.info("\nMissing Values:")
-    logger.info(df.isnull().sum())
-    logger.info("\nData Types:")
-    logger.info(df.dtypes)
+    # One count() pass gives the missing values; dtypes are metadata only
+    logger.info("\nMissing Values and Data Types:")
+    logger.info(pd.concat([(len(df) - df.count()).rename('missing'),
+                           df.dtypes.rename('dtype')], axis=1))
     logger.info("\nSample Values:")
     logger.info(df.head())
 
@@ -119,8 +328,29 @@ def handle_missing_values(df: pd.DataFrame, strategy: str = 'drop', fill_value:
             logger.warning("No fill value provided for 'fill' strategy.")
     
     elif strategy == 'mean':
-        # Fill missing values with the mean of the column
-        df = df.fillna(df.mean())
+        # Fill missing values with the mean of each numeric column, computing
+        # the means and filling the gaps over one float64 matrix
+        columns = [col for col in df.select_dtypes(include='number').columns
+                   if not pd.api.types.is_bool_dtype(df[col])]
+        # copy=True: the gaps are filled in place and must not write through to df
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        filled = np.zeros(len(columns), dtype=bool)
+
+        def fill_shard(shard: slice) -> None:
+            # Shards are disjoint column views, so threads fill in place without locks
+            block = values[:, shard]
+            missing = np.isnan(block)
+            # nansum / count instead of np.nanmean: errstate is thread-local,
+            # unlike warnings.catch_warnings, so it is safe inside a worker
+            counts = (~missing).sum(axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = np.nansum(block, axis=0) / counts  # All-NaN columns stay NaN
+            np.copyto(block, means, where=missing)
+            filled[shard] = missing.any(axis=0)
+
+        _thread_map(fill_shard, _column_shards(len(columns)))
+        df = df.copy(deep=False)
+        df[[col for col, has_gaps in zip(columns, filled) if has_gaps]] = values[:, filled]
         logger.info("Filled missing values with column means.")
     
     elif strategy == 'median':
@@ -149,61 +379,345 @@ def handle_missing_values(df: pd.DataFrame, strategy: str = 'drop', fill_value:
     
     return df
 
+def clean_with_polars(input_file: str, output_file: str, n_std: float = 3) -> None:
+    """
+    Run the cleaning pipeline as a single lazy Polars query.
+
+    Mirrors the pandas steps in main() (dedupe, date parsing, type inference,
+    string cleaning, outlier removal, mean fill) but lets Polars fuse them and
+    stream the result to output_file without materializing intermediate frames.
+    """
+    import polars as pl
+
+    scan = pl.scan_csv(input_file, low_memory=True)
+    lf = scan.unique(maintain_order=True)
+    schema = lf.collect_schema()
+
+    # Convert dates
+    date_columns = [col for col, dtype in schema.items()
+                    if 'date' in col.lower() and dtype == pl.String]
+    if date_columns:
+        lf = lf.with_columns(pl.col(date_columns).str.to_date(strict=False))
+
+    # Infer types: text columns that are more than 80% numeric become Float64.
+    # Only those columns are scanned for the ratios, in one streaming pass
+    text_columns = [col for col, dtype in schema.items()
+                    if dtype == pl.String and col not in date_columns]
+    if text_columns:
+        ratios = scan.select(
+            pl.col(text_columns).str.strip_chars().cast(pl.Float64, strict=False).count()
+            / pl.len()
+        ).collect().row(0, named=True)
+        converted = [col for col, ratio in ratios.items() if ratio is not None and ratio > 0.8]
+        if converted:
+            lf = lf.with_columns(pl.col(converted).str.strip_chars().cast(pl.Float64, strict=False))
+            schema = lf.collect_schema()
+
+    # Clean remaining string columns
+    string_columns = [col for col, dtype in schema.items()
+                      if dtype == pl.String and col not in date_columns]
+    if string_columns:
+        lf = lf.with_columns(
+            pl.col(string_columns)
+            .str.strip_chars()
+            .str.to_lowercase()
+            .str.replace_all(r'[ \n\t]+', ' ')
+            .str.replace_all(r'[^a-z0-9\s.,!?-]', '')
+        )
+
+    # Remove outliers from numeric columns, keeping missing values for the fill
+    numeric_columns = [col for col, dtype in schema.items() if dtype.is_numeric()]
+    if numeric_columns:
+        z_ok = [
+            ((pl.col(col) - pl.col(col).mean()).abs() < n_std * pl.col(col).std())
+            .or_(pl.col(col).std() == 0)
+            .fill_null(True)
+            for col in numeric_columns
+        ]
+        lf = lf.filter(pl.all_horizontal(z_ok))
+        lf = lf.with_columns(pl.col(numeric_columns).fill_null(strategy='mean'))
+
+    # Run the query once, streaming into output_file; the profile then reads
+    # the written result back rather than re-running the whole pipeline
+    if output_file.lower().endswith('.parquet'):
+        lf.sink_parquet(output_file, compression='zstd')
+        result = pl.scan_parquet(output_file)
+    else:
+        lf.sink_csv(output_file)
+        result = pl.scan_csv(output_file)
+
+    logger.info("\nFinal data profile:")
+    logger.info(result.describe())
+    logger.info(f"✅ Success! Cleaned file saved as: {output_file}")
+
+def read_csv_chunks(input_file: str, raw: bool = False, usecols: Optional[List[str]] = None,
+                    column_formats: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read input_file in chunks of CHUNK_SIZE rows with every field as text.
+
+    Reading text keeps a row's values, and so its hash, the same whichever
+    chunk it lands in; numeric types are decided once for the whole file.
+    Unless raw, columns with 'date' in their name are parsed by read_csv
+    itself, with the formats in column_formats (column name -> format) so
+    every chunk parses alike; any that fail to parse stay text and are handled
+    by convert_dates. usecols limits the read to those columns; chunks still
+    line up by row.
+    """
+    header = pd.read_csv(input_file, nrows=0).columns
+    if usecols is not None:
+        header = [col for col in header if col in usecols]
+    date_columns = [] if raw else [col for col in header if 'date' in col.lower()]
+    dtype = {col: _TEXT_DTYPE for col in header if col not in date_columns}
+    return pd.read_csv(input_file, chunksize=CHUNK_SIZE, low_memory=True,
+                       usecols=usecols, dtype=dtype, parse_dates=date_columns,
+                       date_format=column_formats)
+
+def _apply_column_types(df: pd.DataFrame, column_types: dict) -> pd.DataFrame:
+    """Convert the text columns named in column_types to their whole-file numeric dtypes."""
+    return _apply_by_column(df, list(column_types),
+                            lambda s: _coerce_numeric(s).astype(column_types[s.name]))
+
+def clean_chunk(df: pd.DataFrame, column_types: Optional[dict] = None,
+                column_formats: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Run the row-local cleaning steps (strings, dates, types) on one chunk.
+
+    column_types (column name -> dtype) gives the numeric columns decided for
+    the whole file and column_formats (column name -> format) the date
+    formats; without them, both are inferred from the chunk alone.
+    """
+    if column_types is not None:
+        df = _apply_column_types(df, column_types)
+    if column_formats is not None:
+        # Parse dates before string cleaning strips their separators
+        df = convert_dates(df, column_formats=column_formats)
+    df = clean_string_columns(df)
+    if column_formats is None:
+        df = convert_dates(df)
+    if column_types is None:
+        df = infer_and_convert_types(df)
+    return df
+
+def _profile_column(s: pd.Series) -> dict:
+    """Numeric statistics of one text column, for deciding its whole-file type."""
+    values = _coerce_numeric(s).dropna().to_numpy(dtype=np.float64, na_value=np.nan)
+    mean = values.mean() if len(values) else 0.0
+    return {
+        'rows': len(s),
+        'n': len(values),
+        'mean': mean,
+        'm2': ((values - mean) ** 2).sum(),
+        'integral': bool(np.all(np.mod(values, 1) == 0)),
+        'float32': bool(np.all(values.astype(np.float32) == values)),
+        'min': values.min() if len(values) else np.inf,
+        'max': values.max() if len(values) else -np.inf,
+    }
+
+def _merge_profiles(a: dict, b: dict) -> dict:
+    """Combine two column profiles; mean/M2 are merged as in Chan et al."""
+    n = a['n'] + b['n']
+    delta = b['mean'] - a['mean']
+    return {
+        'rows': a['rows'] + b['rows'],
+        'n': n,
+        'mean': a['mean'] + delta * b['n'] / n if n else 0.0,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * a['n'] * b['n'] / n if n else 0.0,
+        'integral': a['integral'] and b['integral'],
+        'float32': a['float32'] and b['float32'],
+        'min': min(a['min'], b['min']),
+        'max': max(a['max'], b['max']),
+    }
+
+def _profile_columns(profiles: dict, df: pd.DataFrame, columns: List[str]) -> None:
+    """Merge the profiles of df's columns into profiles."""
+    for col, profile in zip(columns, _thread_map(lambda col: _profile_column(df[col]), columns)):
+        profiles[col] = _merge_profiles(profiles[col], profile) if col in profiles else profile
+
+def _decide_column_types(profiles: dict) -> dict:
+    """Pick one numeric dtype per column from whole-file profiles; text columns are left out."""
+    column_types = {}
+    for col, p in profiles.items():
+        # If more than 80% of values are numeric, convert the column
+        if not p['rows'] or p['n'] / p['rows'] <= 0.8:
+            continue
+        dtype = np.dtype(np.float32 if p['float32'] else np.float64)
+        if p['integral'] and p['n'] == p['rows']:
+            # Narrowest integer that holds every value; gaps need a float
+            for int_type in (np.int8, np.int16, np.int32, np.int64):
+                if np.iinfo(int_type).min <= p['min'] and p['max'] <= np.iinfo(int_type).max:
+                    dtype = np.dtype(int_type)
+                    break
+        elif p['integral']:
+            dtype = np.dtype(np.float64)
+        column_types[col] = dtype
+    return column_types
+
+def _decide_date_formats(date_formats: dict, df: pd.DataFrame) -> None:
+    """Pick a format for each date column of df not yet in date_formats that has values."""
+    for col in df.columns:
+        if 'date' in col.lower() and col not in date_formats:
+            sample = _date_sample(df[col])
+            if not sample.empty:
+                date_formats[col] = _guess_date_format(sample, DATE_FORMATS)
+
+def _drop_seen_rows(df: pd.DataFrame, seen: set) -> np.ndarray:
+    """Return a mask of rows not duplicated within df or seen, and add them to seen."""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    # One C-level set intersection finds the (usually few) hashes seen
+    # before, instead of a Python membership test per row
+    repeats = seen.intersection(hashes.tolist())
+    already_seen = np.isin(hashes, np.fromiter(repeats, dtype=hashes.dtype, count=len(repeats)))
+    keep = ~(pd.Series(hashes).duplicated().to_numpy() | already_seen)
+    seen.update(hashes[keep].tolist())
+    return keep
+
+def _finish_chunks(chunks: Iterable[pd.DataFrame], means: dict) -> Iterator[pd.DataFrame]:
+    """Fill missing values in cleaned, outlier-free chunks using whole-file means."""
+    for i, df in enumerate(chunks):
+        # Handle missing values with whole-file column means
+        df = handle_missing_values(df, strategy='fill', fill_value=means)
+
+        if i == 0:
+            logger.info("\nFinal data profile (first chunk):")
+            generate_data_profile(df)
+
+        yield df
+
+def _to_arrow_table(df: pd.DataFrame, parquet: bool) -> 'pa.Table':
+    """Convert a cleaned chunk to an Arrow table for writing."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if not parquet and pa.types.is_timestamp(field.type):
+            # Write date-only timestamps as dates and whole-second ones
+            # without fractions, like pandas.to_csv does. These casts drop
+            # precision silently, so only use one that round-trips
+            for target in (pa.date32(), pa.timestamp('s', tz=field.type.tz)):
+                narrowed = column.cast(target, safe=False)
+                if narrowed.cast(field.type).equals(column):
+                    table = table.set_column(i, field.name, narrowed)
+                    break
+    if parquet:
+        # The pandas metadata records the first chunk's dtypes, not the file's
+        table = table.replace_schema_metadata(None)
+    return table
+
+def write_output(chunks: Iterable[pd.DataFrame], output_file: str) -> int:
+    """
+    Write cleaned chunks to output_file and return the number of rows written.
+
+    Files ending in .parquet are written as zstd-compressed Parquet; anything
+    else is written as CSV, using Arrow's C++ writer when pyarrow is installed.
+    """
+    written_rows = 0
+    if output_file.lower().endswith('.parquet'):
+        if pa is None:
+            raise ValueError("Writing Parquet output requires pyarrow.")
+        writer = None
+        try:
+            for df in chunks:
+                table = _to_arrow_table(df, parquet=True)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, table.schema, compression='zstd')
+                writer.write_table(table.cast(writer.schema))
+                written_rows += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+    elif pa is not None:
+        with open(output_file, 'wb') as out:
+            for i, df in enumerate(chunks):
+                pa_csv.write_csv(_to_arrow_table(df, parquet=False), out,
+                                 write_options=pa_csv.WriteOptions(include_header=(i == 0)))
+                written_rows += len(df)
+    else:
+        with open(output_file, 'w', newline='') as out:
+            for i, df in enumerate(chunks):
+                df.to_csv(out, index=False, header=(i == 0))
+                written_rows += len(df)
+    return written_rows
+
 def main():
     try:
         # Get input and output file names from command line
-        if len(sys.argv) != 3:
-            logger.error("Usage: python csv_cleaner.py input_file.csv output_file.csv")
+        if len(sys.argv) not in (3, 5) or (len(sys.argv) == 5 and sys.argv[3] != '--engine'):
+            logger.error("Usage: python csv_cleaner.py input_file.csv output_file.csv [--engine pandas|polars]")
             sys.exit(1)
             
         input_file = sys.argv[1]
         output_file = sys.argv[2]
+        engine = sys.argv[4] if len(sys.argv) == 5 else 'pandas'
 
-        # Read CSV
-        logger.info(f"Reading file: {input_file}")
-        df = pd.read_csv(input_file, low_memory=False)
-        
-        # Generate initial profile
-        logger.info("Initial data profile:")
-        generate_data_profile(df)
+        if engine == 'polars':
+            logger.info(f"Reading file with Polars: {input_file}")
+            clean_with_polars(input_file, output_file)
+            return
+        elif engine != 'pandas':
+            raise ValueError(f"Unknown engine '{engine}'.")
 
-        # Cleaning steps
+        # The file is streamed in chunks so memory stays O(chunk), not O(file).
+        # Deduplication, column types and outlier statistics need the whole
+        # file, so the first pass only gathers them from the raw text. The
+        # second pass reads just the numeric columns to find the outliers and
+        # the means of what is left, which fill the gaps; the third pass
+        # cleans each chunk once and writes it out.
+        logger.info(f"Reading file: {input_file}")
         logger.info("Starting data cleaning process...")
 
-        # Remove duplicates
-        initial_rows = len(df)
-        df = df.drop_duplicates()
-        logger.info(f"Removed {initial_rows - len(df)} duplicate rows")
-
-        # Clean string columns
-        df = clean_string_columns(df)
-        logger.info("Completed string cleaning")
+        # First pass: find duplicate rows and profile the columns
+        keep_masks = []
+        profiles = {}
+        date_formats = {}
+        seen = set()
+        total_rows = 0
+        for i, chunk in enumerate(read_csv_chunks(input_file, raw=True)):
+            if i == 0:
+                logger.info("Initial data profile (first chunk):")
+                generate_data_profile(chunk)
+                # Only profile columns whose sampled values look numeric
+                numeric_candidates = [col for col in chunk.columns if 'date' not in col.lower()
+                                      and _sample_is_numeric(chunk[col])]
+            total_rows += len(chunk)
 
-        # Convert dates
-        df = convert_dates(df)
-        logger.info("Completed date conversion")
+            # Remove duplicates
+            keep = _drop_seen_rows(chunk, seen)
+            keep_masks.append(keep)
+            _profile_columns(profiles, chunk.loc[keep], numeric_candidates)
+            _decide_date_formats(date_formats, chunk)
 
-        # Infer and convert types
-        df = infer_and_convert_types(df)
-        logger.info("Completed type inference and conversion")
+        unique_rows = len(seen)
+        logger.info(f"Removed {total_rows - unique_rows} duplicate rows")
 
-        # Remove outliers from numeric columns
-        numeric_columns = df.select_dtypes(include=['int64', 'float64']).columns
-        if len(numeric_columns) > 0:
-            initial_rows = len(df)
-            df = detect_outliers(df, numeric_columns)
-            logger.info(f"Removed {initial_rows - len(df)} rows with outliers")
+        # Infer and convert types and date formats once for the whole file
+        column_types = _decide_column_types(profiles)
+        means = {col: profiles[col]['mean'] for col in column_types}
+        stds = {col: np.sqrt(profiles[col]['m2'] / (profiles[col]['n'] - 1))
+                if profiles[col]['n'] > 1 else 0.0 for col in column_types}
 
-        # Handle missing values (Example: 'drop', 'fill', 'mean', 'median', 'mode', 'forward_fill', 'backward_fill')
-        df = handle_missing_values(df, strategy='mean')  # Example: Use 'mean' to fill missing values
-        logger.info("Handled missing values")
+        # Second pass: remove outliers from numeric columns and take the
+        # means of the remaining values
+        fill_means = {}
+        if column_types:
+            sums = pd.Series(0.0, index=list(column_types))
+            counts = pd.Series(0, index=list(column_types))
+            chunks = read_csv_chunks(input_file, raw=True, usecols=list(column_types))
+            for chunk, keep in zip(chunks, keep_masks):
+                numeric = _apply_column_types(chunk.loc[keep], column_types)
+                numeric = detect_outliers(numeric, list(column_types), means=means, stds=stds)
+                keep &= chunk.index.isin(numeric.index)
+                numeric = numeric.astype(np.float64)
+                sums += numeric.sum()
+                counts += numeric.count()
+            fill_means = (sums / counts.where(counts > 0)).fillna(0.0).to_dict()
 
-        # Generate final profile
-        logger.info("\nFinal data profile:")
-        generate_data_profile(df)
+        # Third pass: clean, fill missing values and write the output
+        chunks = (clean_chunk(chunk.loc[keep], column_types, date_formats) for chunk, keep in
+                  zip(read_csv_chunks(input_file, column_formats=date_formats), keep_masks))
+        written_rows = write_output(_finish_chunks(chunks, fill_means), output_file)
 
-        # Save clean file
-        df.to_csv(output_file, index=False)
+        logger.info("Completed string cleaning, date conversion and type inference")
+        logger.info(f"Removed {unique_rows - written_rows} rows with outliers")
+        logger.info("Handled missing values")
         logger.info(f"✅ Success! Cleaned file saved as: {output_file}")
 
     except Exception as e: